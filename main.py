@@ -1,97 +1,448 @@
 import requests
-import regex
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
 import datetime
-import dateutil.parser as dparser
 import logging
-import tkinter as tk
-from tkinter import messagebox, simpledialog
 import json
 import re
 from urllib.parse import urlparse
+import os
+import sqlite3
 import sys
+import time
+import functools
+from collections import deque
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('job_posting_checker.log'),
-        logging.StreamHandler()
-    ]
+# Only advertise Brotli/Zstandard when a decoder is installed, otherwise requests cannot decompress the body;
+# urllib3 lists br/zstd here exactly when it can decode them (brotli or brotlicffi, backports.zstd etc.)
+_decodable = URLLIB3_ACCEPT_ENCODING.split(',')
+ACCEPT_ENCODING = ', '.join(['gzip', 'deflate'] + [e for e in ('br', 'zstd') if e in _decodable])
+
+# Prefer the ciso8601 C parser for ISO-8601 dates when it is installed
+try:
+    from ciso8601 import parse_datetime as _fromisoformat
+except ImportError:
+    def _fromisoformat(date_string):
+        """datetime.fromisoformat that also accepts a trailing 'Z'"""
+        if date_string.endswith('Z'):
+            date_string = date_string[:-1] + '+00:00'
+        return datetime.datetime.fromisoformat(date_string)
+
+# orjson parses large JSON-LD blocks several times faster than the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+def _load_json_ld(raw):
+    """Parse a JSON-LD block from raw bytes, dropping bytes that are not valid UTF-8 if the strict parse fails"""
+    try:
+        return _json_loads(raw)
+    except ValueError:
+        # e.g. a Latin-1 company name on a page that is otherwise UTF-8
+        return _json_loads(raw.decode('utf-8', 'ignore'))
+
+# http(s) URL with a host and no whitespace; anything else cannot be fetched
+_URL_RE = re.compile(r'https?://[^\s/?#]+\S*\Z', re.IGNORECASE)
+
+# Content types that can carry a posting date (text/* is accepted too); anything else is not downloaded
+_DATED_CONTENT_TYPES = ('html', 'xml', 'json', 'pdf')
+
+# Once this has been downloaded the rest of the page is rarely needed
+DATE_MARKER = b'datePosted'
+
+# JSON-LD keys that may hold the posting date, most specific first
+_DATE_KEY_ORDER = (
+    'datePosted', 'publishedDate', 'createdDate', 'postingDate',
+    'date_posted', 'posted_date', 'dateCreated', 'created', 'published',
+    'datePublished', 'dateModified', 'dateUpdated', 'lastModified'
+)
+_DATE_KEYS = frozenset(_DATE_KEY_ORDER)
+
+# The patterns below run on the raw page bytes; only captured values are decoded
+
+# Date field names, matched as "name": "value" pairs by one alternation
+_DATE_FIELD_NAMES = (
+    b'datePosted', b'publishedDate', b'createdDate', b'postingDate', b'date_posted',
+    b'posted_date', b'dateCreated', b'created', b'published', b'datePublished'
+)
+_DATE_KEY_RE = re.compile(rb'"(' + b'|'.join(_DATE_FIELD_NAMES) + rb')"\s*:\s*"([^"]+)"', re.IGNORECASE)
+# Position in _DATE_FIELD_NAMES by lower-cased name; a lower rank wins when several fields are present
+_DATE_FIELD_RANK = {name.lower(): rank for rank, name in enumerate(_DATE_FIELD_NAMES)}
+
+# Dated meta tags (itemprop/name/property, either attribute order) and JSON-LD
+# script blocks, combined into one alternation so the markup is scanned once
+_MARKUP_RE = re.compile(
+    rb'(?P<meta><meta\b[^>]*?(?:itemprop|name|property)=["\'](?P<attr1>datePosted|date|article:published_time)["\']'
+    rb'[^>]*?content=["\'](?P<value1>[^"\']+)["\']'
+    rb'|<meta\b[^>]*?content=["\'](?P<value2>[^"\']+)["\']'
+    rb'[^>]*?(?:itemprop|name|property)=["\'](?P<attr2>datePosted|date|article:published_time)["\'])'
+    rb'|(?P<jsonld><script[^>]*type=["\']application/ld\+json["\'][^>]*>(?P<script>.*?)</script>)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Common date formats in plain text, one named group per format
+_TEXT_DATE_RE = re.compile(
+    rb'(?:posted|published|created)[:\s]+(?P<numeric>\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})'
+    rb'|(?P<iso>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2})?)'
+    rb'|(?P<long>\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})'
+    rb'|(?P<rfc>(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s+\d{2}:\d{2}:\d{2}\s*[+-]\d{4})'
+    rb'|(?P<pdf>D:\d{14}[+-]\d{2}\'?\d{2}\'?)',  # PDF date format
+    re.IGNORECASE
 )
+
+# Memoized because the same timestamps recur across a page's meta tags and JSON-LD
+@functools.lru_cache(maxsize=512)
+def _parse_date_string(date_string, trusted):
+    """Parse a date string, trying the cheap ISO-8601 parsers before dateutil"""
+    try:
+        return _fromisoformat(date_string)
+    except ValueError:
+        pass
+    
+    # dateutil is only imported once the stdlib ISO parser has failed
+    import dateutil.parser as dparser
+    
+    try:
+        return dparser.isoparse(date_string)
+    except (ValueError, OverflowError):
+        pass
+    
+    # Values from structured sources are usually clean, so try a strict parse first for them;
+    # anything that still fails gets dateutil's fuzzy format guessing (handles most other formats)
+    if trusted:
+        try:
+            return dparser.parse(date_string)
+        except (ValueError, OverflowError):
+            pass
+    return dparser.parse(date_string, fuzzy=True)
+
 logger = logging.getLogger(__name__)
 
 class JobPostingDateChecker:
+    # Field names that must appear in the page for the line pattern search to have anything to match
+    # (lower-cased, because the probe runs on the lower-cased page to match the IGNORECASE pattern)
+    DATE_KEYWORDS = tuple(name.lower() for name in _DATE_FIELD_NAMES)
+
+    # Substrings (lower-cased, see _lowered) found in every dated meta tag that search_meta_tags can match
+    META_TOKENS = (b'dateposted', b'article:published_time', b'"date"', b"'date'")
+
+    # Fixed attribute set (see __init__): no per-instance __dict__, and attribute reads are slot loads
+    __slots__ = ('today_ttl_seconds', '_today', '_today_ts', 'max_age_days', '_last_markup_scan',
+                 '_last_lowered', 'headers', 'session', 'stream_chunk_size', 'stream_tail_bytes',
+                 'max_content_bytes', 'cache_ttl_seconds', '_url_cache', 'cache_path', '_tk_root', 'use_cli')
+
     def __init__(self):
-        self.today = datetime.date.today()
+        # Today's date, refreshed at most hourly so a long-running checker does not go stale (see today)
+        self.today_ttl_seconds = 3600
+        self._today = None
+        self._today_ts = 0.0
         self.max_age_days = 7  # Don't apply if older than a week
         
-        # Multiple patterns to search for date fields
-        self.date_field_patterns = [
-            r'"datePosted":\s*"([^"]+)"',
-            r'"publishedDate":\s*"([^"]+)"',
-            r'"createdDate":\s*"([^"]+)"',
-            r'"postingDate":\s*"([^"]+)"',
-            r'"date_posted":\s*"([^"]+)"',
-            r'"posted_date":\s*"([^"]+)"',
-            r'"dateCreated":\s*"([^"]+)"',
-            r'"created":\s*"([^"]+)"',
-            r'"published":\s*"([^"]+)"'
-        ]
+        # Last page scanned by _scan_markup, so meta-tag and JSON-LD searches share one pass
+        self._last_markup_scan = None
+        # Last page lower-cased by _lowered, so the substring pre-checks share one copy
+        self._last_lowered = None
         
         # Headers to avoid bot detection
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive'
         }
+        
+        # One session for all fetches so connections (and TLS sessions) are reused
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Streaming download: chunk size, and how much to keep reading after datePosted is seen
+        self.stream_chunk_size = 16 * 1024
+        self.stream_tail_bytes = 4 * 1024
+        # Larger pages are refused (by Content-Length) or truncated while streaming
+        self.max_content_bytes = 5 * 1024 * 1024
+        
+        # Fetched pages and their extracted dates, keyed by normalized URL; kept in memory and,
+        # unless cache_path is None, in an SQLite file so later runs can reuse them
+        self.cache_ttl_seconds = 3600
+        self._url_cache = {}
+        self.cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_cache.sqlite')
+        
+        # Hidden Tk root shared by every dialog, created on first use (see tk_root)
+        self._tk_root = None
+        
+        # Terminal prompts instead of Tk dialogs when asked to (JOB_UI=cli) or when there is no display
+        ui_mode = os.environ.get('JOB_UI', '').lower()
+        if ui_mode in ('cli', 'tk'):
+            self.use_cli = ui_mode == 'cli'
+        else:
+            self.use_cli = (os.name == 'posix' and sys.platform != 'darwin'
+                            and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'))
+
+    @property
+    def today(self):
+        """Today's date, re-read once the cached value is older than today_ttl_seconds"""
+        now = time.time()
+        if self._today is None or now - self._today_ts > self.today_ttl_seconds:
+            self._today = datetime.date.today()
+            self._today_ts = now
+        return self._today
+
+    @property
+    def tk_root(self):
+        """Hidden Tk root shared by every dialog; tkinter is only imported once a dialog is needed"""
+        if self._tk_root is None:
+            import tkinter as tk
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+
+    def close(self):
+        """Destroy the shared Tk root and release pooled connections"""
+        if self._tk_root is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
+        self.session.close()
+
+    def show_message(self, kind, title, message):
+        """Show an info, warning or error message in a dialog, or on the terminal in CLI mode"""
+        if self.use_cli:
+            print(f"[{kind.upper()}] {title}: {message}", file=sys.stdout if kind == 'info' else sys.stderr)
+            return
+        from tkinter import messagebox
+        show = {'info': messagebox.showinfo, 'warning': messagebox.showwarning, 'error': messagebox.showerror}[kind]
+        show(title, message, parent=self.tk_root)
+
+    def ask_yes_no(self, title, message):
+        """Ask a yes/no question in a dialog, or on the terminal in CLI mode (EOF counts as no)"""
+        if self.use_cli:
+            try:
+                return input(f"{title}: {message} (y/n) ").strip().lower() in ('y', 'yes')
+            except EOFError:
+                return False
+        from tkinter import messagebox
+        return messagebox.askyesno(title, message, parent=self.tk_root)
+
+    def ask_string(self, title, prompt, initialvalue=''):
+        """Ask for a line of text in a dialog, or on the terminal in CLI mode; None means cancelled"""
+        if self.use_cli:
+            try:
+                return input(f"{prompt} ")
+            except EOFError:
+                return None
+        from tkinter import simpledialog
+        return simpledialog.askstring(title, prompt, initialvalue=initialvalue, parent=self.tk_root)
 
     def validate_url(self, url):
-        """Validate if the URL is properly formatted"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception as e:
-            logger.error(f"URL validation failed: {e}")
-            return False
+        """Validate if the URL is a properly formatted http(s) URL"""
+        return bool(_URL_RE.match(url))
 
     def get_user_input(self):
         """Get job posting URL from user via popup window"""
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
+        if not self.use_cli:
+            return self._ask_url_dialog()
         
         while True:
-            url = simpledialog.askstring(
+            url = self.ask_string(
                 "Job Posting Date Checker",
-                "Enter the job posting URL (or click Cancel to exit):",
+                "Enter the job posting URL (or press Ctrl-D to exit):",
                 initialvalue="https://"
             )
             
-            if url is None:  # User clicked Cancel
-                root.destroy()
+            if url is None:  # User pressed Ctrl-D
                 return None
             
             if url.strip():  # User entered something
-                root.destroy()
                 return url.strip()
             
             # If empty string, show error and ask again
-            messagebox.showerror("Invalid Input", "Please enter a valid URL or click Cancel to exit.")
+            self.show_message('error', "Invalid Input", "Please enter a valid URL or press Ctrl-D to exit.")
         
-        root.destroy()
         return None
 
-    def fetch_page_content(self, url):
-        """Fetch the content of the job posting page"""
+    def _ask_url_dialog(self):
+        """Ask for a URL in a single Tk dialog that reports invalid input inline; None means cancelled"""
+        import tkinter as tk
+        
+        dialog = tk.Toplevel(self.tk_root)
+        if self.tk_root.winfo_viewable():
+            # Like simpledialog: a transient of the withdrawn root may never be shown by the window manager
+            dialog.transient(self.tk_root)
+        dialog.title("Job Posting Date Checker")
+        dialog.resizable(False, False)
+        result = {'url': None}
+        
+        tk.Label(dialog, text="Enter the job posting URL (or click Cancel to exit):").pack(padx=10, pady=(10, 4), anchor='w')
+        entry = tk.Entry(dialog, width=60)
+        entry.insert(0, "https://")
+        entry.pack(padx=10, fill='x')
+        error_label = tk.Label(dialog, text="", fg="red")
+        error_label.pack(padx=10, anchor='w')
+        
+        def on_ok(event=None):
+            url = entry.get().strip()
+            if not self.validate_url(url):
+                # Keep the dialog open and say what is wrong instead of popping up another window
+                error_label.config(text="Please enter a valid HTTP/HTTPS URL or click Cancel to exit.")
+                entry.focus_set()
+                return
+            result['url'] = url
+            dialog.destroy()
+        
+        def on_edit(event=None):
+            if error_label.cget('text'):
+                error_label.config(text="")
+        
+        buttons = tk.Frame(dialog)
+        buttons.pack(pady=10)
+        tk.Button(buttons, text="OK", width=10, command=on_ok).pack(side='left', padx=5)
+        tk.Button(buttons, text="Cancel", width=10, command=dialog.destroy).pack(side='left', padx=5)
+        entry.bind('<Key>', on_edit)
+        dialog.bind('<Return>', on_ok)
+        dialog.bind('<Escape>', lambda event: dialog.destroy())
+        dialog.protocol('WM_DELETE_WINDOW', dialog.destroy)
+        
+        dialog.lift()
+        entry.focus_force()
+        entry.icursor('end')
+        # A grab on an unmapped window fails on X11, so wait until it is shown (as simpledialog does)
+        dialog.wait_visibility()
+        dialog.grab_set()
+        self.tk_root.wait_window(dialog)
+        return result['url']
+
+    def _cache_key(self, url):
+        """Normalize a URL for cache lookups (drop the fragment, lowercase scheme and host)"""
+        parsed = urlparse(url)
+        return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment='').geturl()
+
+    def _open_cache_db(self):
+        """Open the on-disk page cache, creating its table on first use"""
+        conn = sqlite3.connect(self.cache_path, timeout=5)
+        conn.execute('CREATE TABLE IF NOT EXISTS pages '
+                     '(url TEXT PRIMARY KEY, fetched_at REAL, content BLOB, date_info TEXT)')
+        return conn
+
+    def get_cached_entry(self, url):
+        """Return the cache entry for a URL if it was fetched within the TTL"""
+        key = self._cache_key(url)
+        entry = self._url_cache.get(key)
+        if entry and time.time() - entry['fetched_at'] < self.cache_ttl_seconds:
+            return entry
+        
+        self._url_cache.pop(key, None)
+        if self.cache_path is None:
+            return None
+        
         try:
-            logger.info(f"Fetching content from: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            conn = self._open_cache_db()
+            try:
+                row = conn.execute('SELECT fetched_at, content, date_info FROM pages WHERE url = ?', (key,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug("Could not read page cache: %s", e)
+            return None
+        
+        if row is None or time.time() - row[0] >= self.cache_ttl_seconds:
+            return None
+        entry = {'fetched_at': row[0], 'content': row[1], 'date_info': json.loads(row[2]) if row[2] else None}
+        self._url_cache[key] = entry
+        return entry
+
+    def store_cached_entry(self, url, content, date_info=None):
+        """Cache a fetched page (and its extracted date, if known) in memory and on disk"""
+        key = self._cache_key(url)
+        entry = self._url_cache.get(key)
+        new_content = entry is None or entry['content'] is not content
+        if new_content:
+            entry = {'fetched_at': time.time(), 'content': content, 'date_info': None}
+            self._url_cache[key] = entry
+        if date_info is not None:
+            entry['date_info'] = date_info
+        if self.cache_path is None:
+            return
+        
+        # Only the JSON-friendly fields are stored; the parse is redone from 'date' when reused
+        stored_info = None
+        if entry['date_info'] is not None:
+            stored_info = json.dumps({k: entry['date_info'][k] for k in ('date', 'source', 'original', 'trusted')
+                                      if k in entry['date_info']}, default=str)
+        try:
+            conn = self._open_cache_db()
+            try:
+                with conn:
+                    # Same page as already stored: attach the date without rewriting the content blob
+                    if not new_content and conn.execute('UPDATE pages SET date_info = ? WHERE url = ?',
+                                                        (stored_info, key)).rowcount:
+                        return
+                    conn.execute('DELETE FROM pages WHERE fetched_at < ?', (time.time() - self.cache_ttl_seconds,))
+                    conn.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)',
+                                 (key, entry['fetched_at'], entry['content'], stored_info))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug("Could not write page cache: %s", e)
+
+    def _date_marker_complete(self, buf, marker_pos):
+        """Check whether enough of the page after the datePosted marker has been read"""
+        if buf.rfind(b'<script', 0, marker_pos) > buf.rfind(b'</script>', 0, marker_pos):
+            # Marker is inside a script block (e.g. JSON-LD): read until the block closes
+            return buf.find(b'</script>', marker_pos) != -1
+        return len(buf) - marker_pos >= self.stream_tail_bytes
+
+    def fetch_page_content(self, url, force_refresh=False):
+        """Fetch the raw bytes of the job posting page"""
+        if not force_refresh:
+            entry = self.get_cached_entry(url)
+            if entry:
+                logger.info("Using cached content for: %s", url)
+                return entry['content']
+        
+        try:
+            logger.info("Fetching content from: %s", url)
+            # Stream the body and stop once the posting date has been downloaded;
+            # it usually sits in the <head>, well before the end of the page
+            with self.session.get(url, timeout=(5, 25), stream=True) as response:
+                response.raise_for_status()
+                
+                # Headers arrive before the body, so unusable responses are skipped without downloading them
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and not content_type.startswith('text/') and not any(t in content_type for t in _DATED_CONTENT_TYPES):
+                    logger.error("Unsupported content type: %s", content_type)
+                    return None
+                content_length = response.headers.get('Content-Length', '')
+                if content_length.isdigit() and int(content_length) > self.max_content_bytes:
+                    logger.error("Page is too large to check (%s bytes)", content_length)
+                    return None
+                
+                buf = bytearray()
+                marker_pos = -1
+                for chunk in response.iter_content(self.stream_chunk_size):
+                    scan_from = max(0, len(buf) - len(DATE_MARKER))
+                    buf.extend(chunk)
+                    if marker_pos == -1:
+                        marker_pos = buf.find(DATE_MARKER, scan_from)
+                    if marker_pos != -1 and self._date_marker_complete(buf, marker_pos):
+                        logger.info("Found datePosted after %s bytes, stopping download early", len(buf))
+                        break
+                    if len(buf) >= self.max_content_bytes:
+                        logger.warning("Page exceeds %s bytes, checking only the first part", self.max_content_bytes)
+                        del buf[self.max_content_bytes:]
+                        break
             
-            logger.info(f"Successfully fetched page content. Status code: {response.status_code}")
-            return response.content.decode('utf-8', errors='ignore')
+            logger.info("Successfully fetched page content. Status code: %s", response.status_code)
+            content = bytes(buf)
+            self.store_cached_entry(url, content)
+            return content
             
         except requests.exceptions.Timeout:
             logger.error("Request timed out")
@@ -100,157 +451,233 @@ class JobPostingDateChecker:
             logger.error("Connection error occurred")
             return None
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error occurred: {e}")
+            logger.error("HTTP error occurred: %s", e)
+            return None
+        except requests.exceptions.RetryError as e:
+            logger.error("Server kept failing, gave up after retries: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching page: {e}")
+            logger.error("Unexpected error fetching page: %s", e)
             return None
 
     def extract_date_from_content(self, content):
-        """Extract posting date from page content using multiple methods"""
+        """Extract posting date from page content (bytes, or str which is encoded) using multiple methods"""
         logger.info("Searching for posting date in page content...")
+        if isinstance(content, str):
+            content = content.encode('utf-8', 'replace')
         
-        # Method 1: Search for meta tags with itemprop="datePosted"
-        date_info = self.search_meta_tags(content)
-        if date_info:
-            return date_info
-        
-        # Method 2: Search for structured data (JSON-LD)
-        date_info = self.search_structured_data(content)
-        if date_info:
-            return date_info
+        try:
+            # Fast path: datePosted at the top of the first JSON-LD block (schema.org JobPosting)
+            date_info = self._fast_jsonld_jobposting(content)
+            if date_info:
+                return date_info
+            
+            # Method 1: Search for meta tags with itemprop="datePosted"
+            date_info = self.search_meta_tags(content)
+            if date_info:
+                return date_info
+            
+            # Method 2: Search for structured data (JSON-LD)
+            date_info = self.search_structured_data(content)
+            if date_info:
+                return date_info
+            
+            # Method 3: Search line by line for date patterns
+            date_info = self.search_line_patterns(content)
+            if date_info:
+                return date_info
+            
+            # Method 4: Search for common date formats in text
+            date_info = self.search_text_patterns(content)
+            if date_info:
+                return date_info
+            
+            logger.warning("No posting date found in page content")
+            return None
+        finally:
+            # The per-page memos hold page-sized data (the lower-cased copy, the markup scan);
+            # drop them so nothing outlives this call
+            self._last_lowered = None
+            self._last_markup_scan = None
+
+    def _fast_jsonld_jobposting(self, content):
+        """Read datePosted from the first JSON-LD block using plain string searches"""
+        try:
+            marker = content.find(b'application/ld+json')
+            if marker == -1:
+                return None
+            start = content.find(b'>', marker) + 1
+            end = content.find(b'</script>', start)
+            if start == 0 or end == -1:
+                return None
+            
+            data = _load_json_ld(content[start:end])
+            date_value = data.get('datePosted') if isinstance(data, dict) else None
+            if isinstance(date_value, str):
+                best_date = self.select_best_date([{
+                    'date': date_value,
+                    'source': 'JSON-LD structured data',
+                    'original': date_value,
+                    'trusted': True
+                }])
+                if best_date:
+                    logger.info("Found date in first JSON-LD block: %s", best_date['date'])
+                    return best_date
+                    
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError on non-UTF-8 pages
+            pass
         
-        # Method 3: Search line by line for date patterns
-        date_info = self.search_line_patterns(content)
-        if date_info:
-            return date_info
+        return None
+
+    def _lowered(self, content):
+        """Lower-cased copy of the page for case-insensitive substring checks, reusing the last page's copy"""
+        if self._last_lowered is None or self._last_lowered[0] is not content:
+            self._last_lowered = (content, content.lower())
+        return self._last_lowered[1]
+
+    def _scan_markup(self, content):
+        """Collect dated meta tags and JSON-LD script bodies in one pass, reusing the last page's scan"""
+        if self._last_markup_scan is not None and self._last_markup_scan[0] is content:
+            return self._last_markup_scan[1]
         
-        # Method 4: Search for common date formats in text
-        date_info = self.search_text_patterns(content)
-        if date_info:
-            return date_info
+        meta_tags = []
+        json_scripts = []
+        for match in _MARKUP_RE.finditer(content):
+            if match.group('jsonld') is not None:
+                json_scripts.append(match.group('script'))
+            else:
+                attr = match.group('attr1') or match.group('attr2')
+                value = match.group('value1') or match.group('value2')
+                meta_tags.append((attr.decode('ascii'), value.decode('utf-8', 'replace')))
         
-        logger.warning("No posting date found in page content")
-        return None
+        self._last_markup_scan = (content, (meta_tags, json_scripts))
+        return meta_tags, json_scripts
 
     def search_meta_tags(self, content):
         """Search for dates in meta tags with itemprop or name attributes"""
+        # Substring checks are far cheaper than the regex scan on pages without dated meta tags
+        lowered = self._lowered(content)
+        if not any(token in lowered for token in self.META_TOKENS):
+            return None
+        
         try:
-            # Pattern for meta tags with datePosted itemprop
-            meta_patterns = [
-                r'<meta\s+itemprop=["\']datePosted["\'][^>]*content=["\']([^"\']+)["\'][^>]*/?>', 
-                r'<meta\s+[^>]*content=["\']([^"\']+)["\'][^>]*itemprop=["\']datePosted["\'][^>]*/?>', 
-                r'<meta\s+name=["\']datePosted["\'][^>]*content=["\']([^"\']+)["\'][^>]*/?>', 
-                r'<meta\s+[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']datePosted["\'][^>]*/?>', 
-                r'<meta\s+name=["\']date["\'][^>]*content=["\']([^"\']+)["\'][^>]*/?>', 
-                r'<meta\s+[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']date["\'][^>]*/?>', 
-                r'<meta\s+property=["\']article:published_time["\'][^>]*content=["\']([^"\']+)["\'][^>]*/?>', 
-                r'<meta\s+[^>]*content=["\']([^"\']+)["\'][^>]*property=["\']article:published_time["\'][^>]*/?>'
-            ]
-            
             found_dates = []
             
-            for pattern in meta_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                if matches:
-                    for date_value in matches:
-                        # Try to parse and convert PDF date format if needed
-                        processed_date = self.process_date_format(date_value)
-                        if processed_date:
-                            found_dates.append({
-                                'date': processed_date, 
-                                'source': f'Meta tag pattern: {pattern}',
-                                'original': date_value
-                            })
+            meta_tags, _ = self._scan_markup(content)
+            for attr, date_value in meta_tags:
+                # Try to parse and convert PDF date format if needed
+                processed_date = self.process_date_format(date_value)
+                if processed_date:
+                    found_dates.append({
+                        'date': processed_date, 
+                        'source': f'Meta tag ({attr})',
+                        'original': date_value,
+                        'trusted': True
+                    })
             
             if found_dates:
                 # If multiple dates found, prefer the one in the past
-                best_date = self.select_best_date(found_dates)
+                best_date = self.select_best_date(self.dedupe_candidates(found_dates))
                 if best_date:
-                    logger.info(f"Found date in meta tag: {best_date['date']} (original: {best_date['original']})")
+                    logger.info("Found date in meta tag: %s (original: %s)", best_date['date'], best_date['original'])
                     return best_date
                     
         except Exception as e:
-            logger.debug(f"Error searching meta tags: {e}")
+            logger.debug("Error searching meta tags: %s", e)
         
         return None
 
+    def _parse_pdf_date(self, date_value):
+        """Parse a PDF date like D:20250804000000+01'00' into a datetime, or return None if too short"""
+        if len(date_value) < 16:
+            return None
+        parsed_date = datetime.datetime.strptime(date_value[2:16], "%Y%m%d%H%M%S")
+        
+        # Offset is +HH'MM' (apostrophes optional); anything else (e.g. 'Z') is left naive
+        sign = date_value[16:17]
+        if sign in ('+', '-'):
+            hours = int(date_value[17:19])
+            minutes = int((date_value[20:22] if date_value[19:20] == "'" else date_value[19:21]) or 0)
+            offset = datetime.timedelta(hours=hours, minutes=minutes)
+            parsed_date = parsed_date.replace(tzinfo=datetime.timezone(-offset if sign == '-' else offset))
+        return parsed_date
+
     def process_date_format(self, date_value):
-        """Process and convert various date formats"""
+        """Process and convert various date formats (PDF dates are returned as datetime objects)"""
         try:
             # Handle PDF date format: D:20250804000000+01'00'
             if date_value.startswith('D:'):
-                # Extract the date part: D:20250804000000+01'00' -> 20250804000000+01'00'
-                date_part = date_value[2:]
-                # Remove the apostrophe: 20250804000000+01'00' -> 20250804000000+0100
-                date_part = date_part.replace("'", "")
-                
-                # Parse the date: YYYYMMDDHHMMSS+HHMM format
-                if len(date_part) >= 14:
-                    year = date_part[0:4]
-                    month = date_part[4:6]
-                    day = date_part[6:8]
-                    hour = date_part[8:10]
-                    minute = date_part[10:12]
-                    second = date_part[12:14]
-                    
-                    # Construct ISO format
-                    iso_date = f"{year}-{month}-{day}T{hour}:{minute}:{second}"
-                    
-                    # Add timezone if present
-                    if len(date_part) > 14 and ('+' in date_part[14:] or '-' in date_part[14:]):
-                        tz_part = date_part[14:]
-                        if len(tz_part) >= 5:
-                            tz_hours = tz_part[1:3]
-                            tz_minutes = tz_part[3:5]
-                            iso_date += f"{tz_part[0]}{tz_hours}:{tz_minutes}"
-                    
-                    logger.debug(f"Converted PDF date '{date_value}' to ISO format: '{iso_date}'")
-                    return iso_date
+                parsed_date = self._parse_pdf_date(date_value)
+                if parsed_date is not None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Converted PDF date '%s' to datetime: '%s'", date_value, parsed_date.isoformat())
+                    return parsed_date
             
             # Return original date for other formats
             return date_value
             
         except Exception as e:
-            logger.debug(f"Error processing date format '{date_value}': {e}")
+            logger.debug("Error processing date format '%s': %s", date_value, e)
             return date_value
 
+    def dedupe_candidates(self, date_candidates):
+        """Drop candidates whose date string was already seen, keeping the first occurrence"""
+        unique = {}
+        for candidate in date_candidates:
+            unique.setdefault(candidate['date'], candidate)
+        return list(unique.values())
+
     def select_best_date(self, date_candidates):
         """Select the best date from multiple candidates, preferring past dates"""
+        today = self.today
+        
+        # Fast path: a single candidate needs no comparison
+        if len(date_candidates) == 1:
+            candidate = date_candidates[0]
+            try:
+                candidate['parsed'] = self._parse_date_value(candidate['date'], trusted=candidate.get('trusted'))
+                candidate['days_from_today'] = (today - candidate['parsed'].date()).days
+                return candidate
+            except Exception as e:
+                logger.debug("Could not parse candidate date '%s': %s", candidate['date'], e)
+                return None
+        
         try:
-            valid_dates = []
+            # Most recent past date (smallest days_from_today >= 0) and closest future date, tracked in one pass
+            best_past = None
+            best_future = None
             
             for candidate in date_candidates:
                 try:
-                    parsed_date = dparser.parse(candidate['date'], fuzzy=True)
-                    candidate['parsed'] = parsed_date
-                    candidate['days_from_today'] = (self.today - parsed_date.date()).days
-                    valid_dates.append(candidate)
+                    parsed_date = self._parse_date_value(candidate['date'], trusted=candidate.get('trusted'))
+                    days = (today - parsed_date.date()).days
                 except Exception as e:
-                    logger.debug(f"Could not parse candidate date '{candidate['date']}': {e}")
+                    logger.debug("Could not parse candidate date '%s': %s", candidate['date'], e)
                     continue
-            
-            if not valid_dates:
-                return None
-            
-            # Separate past and future dates
-            past_dates = [d for d in valid_dates if d['days_from_today'] >= 0]
-            future_dates = [d for d in valid_dates if d['days_from_today'] < 0]
+                candidate['parsed'] = parsed_date
+                candidate['days_from_today'] = days
+                if days == 0:
+                    # Nothing can beat a date from today, so stop parsing
+                    logger.info("Selected past date: %s (0 days ago)", candidate['date'])
+                    return candidate
+                if days > 0:
+                    if best_past is None or days < best_past['days_from_today']:
+                        best_past = candidate
+                elif best_future is None or days > best_future['days_from_today']:
+                    best_future = candidate
             
             # Prefer past dates
-            if past_dates:
-                # Among past dates, prefer the most recent one (smallest positive days_from_today)
-                best_date = min(past_dates, key=lambda x: x['days_from_today'])
-                logger.info(f"Selected past date: {best_date['date']} ({best_date['days_from_today']} days ago)")
-                return best_date
-            elif future_dates:
+            if best_past is not None:
+                logger.info("Selected past date: %s (%s days ago)", best_past['date'], best_past['days_from_today'])
+                return best_past
+            if best_future is not None:
                 # If only future dates available, select the closest to today
-                best_date = max(future_dates, key=lambda x: x['days_from_today'])
-                logger.info(f"Only future dates available, selected: {best_date['date']} ({abs(best_date['days_from_today'])} days ahead)")
-                return best_date
+                logger.info("Only future dates available, selected: %s (%s days ahead)", best_future['date'], abs(best_future['days_from_today']))
+                return best_future
+            return None
             
         except Exception as e:
-            logger.debug(f"Error selecting best date: {e}")
+            logger.debug("Error selecting best date: %s", e)
         
         # Fallback to first valid date
         if date_candidates:
@@ -260,138 +687,159 @@ class JobPostingDateChecker:
 
     def search_structured_data(self, content):
         """Search for dates in JSON-LD structured data"""
+        if b'application/ld+json' not in self._lowered(content):
+            return None
+        
         try:
             # Find JSON-LD script tags
-            json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-            json_scripts = re.findall(json_ld_pattern, content, re.DOTALL | re.IGNORECASE)
+            _, json_scripts = self._scan_markup(content)
             
             found_dates = []
             
             for script in json_scripts:
                 try:
-                    data = json.loads(script.strip())
+                    data = _load_json_ld(script)
                     if isinstance(data, dict):
                         date_value = self.find_date_in_json(data)
                         if date_value:
                             found_dates.append({
                                 'date': date_value, 
                                 'source': 'JSON-LD structured data',
-                                'original': date_value
+                                'original': date_value,
+                                'trusted': True
                             })
-                except json.JSONDecodeError:
+                except ValueError:  # JSONDecodeError, or UnicodeDecodeError on non-UTF-8 pages
                     continue
             
             if found_dates:
                 # If multiple dates found, prefer the one in the past
-                best_date = self.select_best_date(found_dates)
+                best_date = self.select_best_date(self.dedupe_candidates(found_dates))
                 if best_date:
-                    logger.info(f"Found date in JSON-LD: {best_date['date']} (original: {best_date['original']})")
+                    logger.info("Found date in JSON-LD: %s (original: %s)", best_date['date'], best_date['original'])
                     return best_date
                     
         except Exception as e:
-            logger.debug(f"Error searching structured data: {e}")
+            logger.debug("Error searching structured data: %s", e)
         
         return None
 
+    def _find_date_in_node(self, node):
+        """Return the highest-priority date key of a single dict, without descending into it"""
+        for key in _DATE_KEY_ORDER:
+            value = node.get(key)
+            if isinstance(value, str):
+                return value
+        return None
+
     def find_date_in_json(self, data, keys_to_check=None):
-        """Recursively search for date fields in JSON data"""
-        if keys_to_check is None:
-            keys_to_check = ['datePosted', 'publishedDate', 'createdDate', 'postingDate', 
-                           'date_posted', 'posted_date', 'dateCreated', 'created', 'published',
-                           'datePublished', 'dateModified', 'dateUpdated', 'lastModified']
-        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in keys_to_check and isinstance(value, str):
-                    return value
-                elif isinstance(value, (dict, list)):
-                    result = self.find_date_in_json(value, keys_to_check)
-                    if result:
-                        return result
-        elif isinstance(data, list):
-            for item in data:
-                result = self.find_date_in_json(item, keys_to_check)
-                if result:
-                    return result
+        """Search JSON data for date fields, trying the usual schema.org JobPosting layouts first"""
+        if keys_to_check is None and isinstance(data, dict):
+            # Fast path: datePosted on the top-level object or on one of its @graph items
+            date_value = self._find_date_in_node(data)
+            if date_value:
+                return date_value
+            graph = data.get('@graph')
+            if isinstance(graph, list):
+                for item in graph:
+                    if isinstance(item, dict):
+                        date_value = self._find_date_in_node(item)
+                        if date_value:
+                            return date_value
+        
+        return self._find_date_in_json_slow(data, keys_to_check or _DATE_KEYS)
+
+    def _find_date_in_json_slow(self, data, keys_to_check):
+        """Search JSON data breadth-first for date fields, so shallower keys are checked first"""
+        queue = deque([data])
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in keys_to_check and isinstance(value, str):
+                        return value
+                    elif isinstance(value, (dict, list)):
+                        queue.append(value)
+            elif isinstance(node, list):
+                queue.extend(node)
         
         return None
 
     def search_line_patterns(self, content):
-        """Search for date patterns line by line"""
-        for line in content.split('\n'):
-            for pattern in self.date_field_patterns:
-                match = regex.search(pattern, line, regex.IGNORECASE)
-                if match:
-                    date_value = match.group(1)
-                    logger.info(f"Found date pattern: {date_value}")
-                    return {'date': date_value, 'source': f'Pattern match: {pattern}'}
+        """Search for date field patterns in a single pass over the content"""
+        lowered = self._lowered(content)
+        if not any(keyword in lowered for keyword in self.DATE_KEYWORDS):
+            return None
+        
+        # Keep the highest-priority field rather than whichever appears first in the page
+        match = None
+        best_rank = len(_DATE_FIELD_NAMES)
+        for candidate in _DATE_KEY_RE.finditer(content):
+            rank = _DATE_FIELD_RANK[candidate.group(1).lower()]
+            if rank < best_rank:
+                match, best_rank = candidate, rank
+                if rank == 0:
+                    break  # datePosted cannot be beaten
+        
+        if match:
+            field_name = match.group(1).decode('ascii')
+            date_value = match.group(2).decode('utf-8', 'replace')
+            logger.info("Found date pattern: %s", date_value)
+            return {'date': date_value, 'source': f'Pattern match: "{field_name}"', 'trusted': True}
         
         return None
 
     def search_text_patterns(self, content):
         """Search for common date formats in plain text"""
-        # Common date patterns
-        date_patterns = [
-            r'posted[:\s]+(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})',
-            r'published[:\s]+(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})',
-            r'created[:\s]+(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})',
-            r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})',
-            r'(\d{4}-\d{2}-\d{2})',
-            r'(\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})',
-            r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s+\d{2}:\d{2}:\d{2}\s*[+-]\d{4}',
-            r'D:(\d{14}[+-]\d{2}\'?\d{2}\'?)',  # PDF date format
-        ]
-        
         found_dates = []
         
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                for match in matches:
-                    date_value = match if isinstance(match, str) else match[0]
-                    
-                    # Process PDF dates
-                    if pattern.startswith('D:'):
-                        date_value = f"D:{date_value}"
-                    
-                    processed_date = self.process_date_format(date_value)
-                    if processed_date:
-                        found_dates.append({
-                            'date': processed_date, 
-                            'source': f'Text pattern: {pattern}',
-                            'original': date_value
-                        })
+        for match in _TEXT_DATE_RE.finditer(content):
+            kind = match.lastgroup
+            date_value = match.group(kind).decode('ascii')
+            
+            # PDF dates need converting; every other format is passed through
+            processed_date = self.process_date_format(date_value) if kind == 'pdf' else date_value
+            if processed_date:
+                found_dates.append({
+                    'date': processed_date, 
+                    'source': f'Text pattern ({kind})',
+                    'original': date_value,
+                    'trusted': False
+                })
         
         if found_dates:
             # If multiple dates found, prefer the one in the past
-            best_date = self.select_best_date(found_dates)
+            best_date = self.select_best_date(self.dedupe_candidates(found_dates))
             if best_date:
-                logger.info(f"Found date in text: {best_date['date']} (original: {best_date['original']})")
+                logger.info("Found date in text: %s (original: %s)", best_date['date'], best_date['original'])
                 return best_date
         
         return None
 
-    def parse_date(self, date_string):
-        """Parse date string into datetime object"""
+    def _parse_date_value(self, date_string, trusted=False):
+        """Parse a date value, passing already-parsed datetimes through"""
+        if isinstance(date_string, datetime.datetime):
+            return date_string  # Already parsed, e.g. a PDF date from process_date_format
+        
+        return _parse_date_string(date_string, bool(trusted))
+
+    def parse_date(self, date_string, trusted=False):
+        """Parse date string into datetime object (trusted values try a strict parse before the fuzzy one)"""
         try:
-            # Try parsing with dateutil (handles most formats)
-            parsed_date = dparser.parse(date_string, fuzzy=True)
-            logger.info(f"Successfully parsed date: {parsed_date}")
+            parsed_date = self._parse_date_value(date_string, trusted=trusted)
+            logger.info("Successfully parsed date: %s", parsed_date)
             return parsed_date
         except (ValueError, TypeError) as e:
-            logger.error(f"Failed to parse date '{date_string}': {e}")
+            logger.error("Failed to parse date '%s': %s", date_string, e)
             return None
 
     def calculate_days_since_posted(self, parsed_date):
-        """Calculate days since the job was posted"""
-        try:
-            posting_date = parsed_date.date()
-            days_since = (self.today - posting_date).days
-            logger.info(f"Job posted {days_since} days ago")
-            return days_since
-        except Exception as e:
-            logger.error(f"Error calculating days since posted: {e}")
+        """Calculate days since the job was posted (parsed_date is a datetime from parse_date, or None)"""
+        if parsed_date is None:
             return None
+        
+        days_since = (self.today - parsed_date.date()).days
+        logger.info("Job posted %s days ago", days_since)
+        return days_since
 
     def should_apply(self, days_since_posted):
         """Determine if user should apply based on posting age"""
@@ -424,19 +872,15 @@ Job Posting Analysis Results:
 """
         
         print(result_message)
-        logger.info(f"Analysis complete. Recommendation: {reason}")
-        
-        # Show popup with results and ask if user wants to check another URL
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showinfo("Job Posting Analysis Results", result_message)
+        logger.info("Analysis complete. Recommendation: %s", reason)
         
-        # Ask if user wants to check another URL
-        check_another = messagebox.askyesno(
-            "Check Another URL?", 
-            "Would you like to check another job posting URL?"
+        # One popup shows the results and asks whether to check another URL
+        # (the message was already printed, so CLI mode only asks the question)
+        question = "Would you like to check another job posting URL?"
+        check_another = self.ask_yes_no(
+            "Job Posting Analysis Results",
+            question if self.use_cli else f"{result_message}\n{question}"
         )
-        root.destroy()
         
         return check_another
 
@@ -456,53 +900,56 @@ Job Posting Analysis Results:
                 if not self.validate_url(url):
                     error_msg = "Invalid URL format. Please provide a valid HTTP/HTTPS URL."
                     logger.error(error_msg)
-                    root = tk.Tk()
-                    root.withdraw()
-                    messagebox.showerror("Invalid URL", error_msg)
-                    root.destroy()
+                    self.show_message('error', "Invalid URL", error_msg)
                     continue  # Ask for another URL
                 
-                # Fetch page content
-                content = self.fetch_page_content(url)
-                if not content:
-                    error_msg = "Failed to fetch page content. Please check the URL and try again."
-                    logger.error(error_msg)
-                    root = tk.Tk()
-                    root.withdraw()
-                    messagebox.showerror("Fetch Error", error_msg)
-                    root.destroy()
-                    continue  # Ask for another URL
-                
-                # Extract date information
-                date_info = self.extract_date_from_content(content)
-                if not date_info:
-                    warning_msg = "Could not find posting date on this page. The job might be very new or the site format is not supported."
-                    logger.warning(warning_msg)
-                    root = tk.Tk()
-                    root.withdraw()
-                    messagebox.showwarning("Date Not Found", warning_msg)
-                    check_another = messagebox.askyesno(
-                        "Check Another URL?", 
-                        "Would you like to try another job posting URL?"
+                # Offer to reuse a recent analysis of the same URL
+                cached = self.get_cached_entry(url)
+                force_refresh = False
+                if cached:
+                    force_refresh = not self.ask_yes_no(
+                        "Cached Result",
+                        "This URL was checked recently. Use the cached page?\n\nChoose No to download it again."
                     )
-                    root.destroy()
-                    if not check_another:
-                        break
-                    continue  # Ask for another URL
+                
+                date_info = cached['date_info'] if cached and not force_refresh else None
+                if date_info:
+                    logger.info("Using cached date for: %s", url)
+                else:
+                    # Fetch page content
+                    content = self.fetch_page_content(url, force_refresh=force_refresh)
+                    if not content:
+                        error_msg = "Failed to fetch page content. Please check the URL and try again."
+                        logger.error(error_msg)
+                        self.show_message('error', "Fetch Error", error_msg)
+                        continue  # Ask for another URL
+                    
+                    # Extract date information
+                    date_info = self.extract_date_from_content(content)
+                    if not date_info:
+                        warning_msg = "Could not find posting date on this page. The job might be very new or the site format is not supported."
+                        logger.warning(warning_msg)
+                        self.show_message('warning', "Date Not Found", warning_msg)
+                        check_another = self.ask_yes_no(
+                            "Check Another URL?", 
+                            "Would you like to try another job posting URL?"
+                        )
+                        if not check_another:
+                            break
+                        continue  # Ask for another URL
+                    
+                    self.store_cached_entry(url, content, date_info)
                 
                 # Parse the date
-                parsed_date = self.parse_date(date_info['date'])
+                parsed_date = self.parse_date(date_info['date'], trusted=date_info.get('trusted'))
                 if not parsed_date:
                     error_msg = f"Found a date ({date_info['date']}) but could not parse it into a valid format."
                     logger.error(error_msg)
-                    root = tk.Tk()
-                    root.withdraw()
-                    messagebox.showerror("Date Parse Error", error_msg)
-                    check_another = messagebox.askyesno(
+                    self.show_message('error', "Date Parse Error", error_msg)
+                    check_another = self.ask_yes_no(
                         "Check Another URL?", 
                         "Would you like to try another job posting URL?"
                     )
-                    root.destroy()
                     if not check_another:
                         break
                     continue  # Ask for another URL
@@ -525,11 +972,20 @@ Job Posting Analysis Results:
         except Exception as e:
             error_msg = f"An unexpected error occurred: {e}"
             logger.error(error_msg)
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Unexpected Error", error_msg)
-            root.destroy()
+            self.show_message('error', "Unexpected Error", error_msg)
+        finally:
+            self.close()
 
 if __name__ == "__main__":
+    # Configure logging (only when run as a script, so importing the module has no side effects)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('job_posting_checker.log'),
+            logging.StreamHandler()
+        ]
+    )
+    
     checker = JobPostingDateChecker()
     checker.run()